@@ -1,14 +1,24 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.backends.backend_pdf import PdfPages
-from mpl_toolkits.mplot3d import Axes3D
+import matplotlib
+matplotlib.use('Agg')  # Figures are only rendered server-side, never shown interactively
+from matplotlib.figure import Figure
+from matplotlib.colors import ListedColormap, to_rgba
+from matplotlib.patches import FancyBboxPatch
+from matplotlib.collections import LineCollection, PolyCollection
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 import plotly.graph_objects as go
 import io
-import copy
+import json
+import uuid
+from functools import partial
+from dataclasses import dataclass, field
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # Optional faster JSON encoder; fall back to the json module
+    orjson = None
+
 # Wood type library with realistic colors
 WOOD_TYPES = {
     "Maple": "#F5DEB3",
@@ -25,6 +35,21 @@ WOOD_TYPES = {
     "Red Oak": "#C19A6B",
 }
 
+# Wood colors pre-parsed to RGBA, so collections don't parse hex strings per face
+WOOD_RGBA = {name: to_rgba(color) for name, color in WOOD_TYPES.items()}
+
+def luminance(rgba):
+    """Perceived brightness of an RGBA color, from 0 (black) to 1 (white)"""
+    r, g, b, _ = rgba
+    return 0.299 * r + 0.587 * g + 0.114 * b
+
+# Label text color per wood: white on dark woods, black on light ones
+WOOD_TEXT_COLOR = {name: 'white' if luminance(rgba) < 0.5 else 'black'
+                   for name, rgba in WOOD_RGBA.items()}
+
+# Wood type names in display order, for selectbox options
+WOOD_TYPE_NAMES = tuple(WOOD_TYPES)
+
 # Board size presets (width x length in inches)
 BOARD_PRESETS = {
     "Small (8\" × 12\")": (8, 12),
@@ -34,6 +59,7 @@ BOARD_PRESETS = {
     "Extra Large (16\" × 24\")": (16, 24),
     "Custom": None
 }
+BOARD_PRESET_NAMES = tuple(BOARD_PRESETS)
 
 # Pattern presets (wood_type, width in inches)
 PATTERN_PRESETS = {
@@ -113,6 +139,7 @@ PATTERN_PRESETS = {
         ('Wenge', 1.2)
     ]
 }
+PATTERN_PRESET_NAMES = tuple(PATTERN_PRESETS)
 
 # Unit conversion
 def inches_to_cm(inches):
@@ -127,109 +154,222 @@ def inches_to_mm(inches):
 def mm_to_inches(mm):
     return mm / 25.4
 
+# Display formatting per measurement unit: (scale from inches, number format, suffix)
+UNIT_FORMATS = {
+    "inches": (1.0, ".3f", "\""),
+    "centimeters": (inches_to_cm(1.0), ".2f", " cm"),
+    "millimeters": (inches_to_mm(1.0), ".1f", " mm"),
+}
+
+@dataclass(eq=False)
+class Strips:
+    """Board strips stored as parallel arrays, one entry per strip in board order
+
+    Each strip also has a uid that stays with it when strips are reordered,
+    so its widgets keep a stable key.
+    """
+    widths: np.ndarray = field(default_factory=lambda: np.empty(0))
+    wood_types: list = field(default_factory=list)
+    uids: list = field(default_factory=list)
+
+    @classmethod
+    def from_pairs(cls, pairs, with_uids=True):
+        """Build strips from (wood_type, width) pairs
+
+        Pass with_uids=False for read-only strips that never back widgets
+        (drawing, serializing); they get no uids and must not be edited.
+        """
+        pairs = list(pairs)
+        return cls(
+            widths=np.array([width for _, width in pairs], dtype=float),
+            wood_types=[wood_type for wood_type, _ in pairs],
+            uids=[uuid.uuid4().hex for _ in pairs] if with_uids else []
+        )
+
+    @classmethod
+    def from_records(cls, records):
+        """Build strips from a list of strip dicts, as stored in saved designs"""
+        pairs = [(record['wood_type'], record['width']) for record in records]
+        unknown = {wood_type for wood_type, _ in pairs} - WOOD_TYPES.keys()
+        if unknown:
+            raise ValueError(f"Unknown wood type(s): {', '.join(sorted(unknown))}")
+        return cls.from_pairs(pairs)
+
+    def to_records(self):
+        """Return the strips as a list of strip dicts, as stored in saved designs"""
+        return [{'wood_type': wood_type, 'width': width, 'color': color}
+                for wood_type, width, color in self]
+
+    def __len__(self):
+        return len(self.wood_types)
+
+    def __iter__(self):
+        """Iterate over (wood_type, width, color) tuples"""
+        return zip(self.wood_types, self.widths.tolist(), self.colors())
+
+    def append(self, wood_type, width):
+        self.insert(len(self), wood_type, width)
+
+    def insert(self, index, wood_type, width):
+        self.widths = np.insert(self.widths, index, width)
+        self.wood_types.insert(index, wood_type)
+        self.uids.insert(index, uuid.uuid4().hex)
+
+    def pop(self, index=-1):
+        index = range(len(self))[index]
+        self.widths = np.delete(self.widths, index)
+        self.uids.pop(index)
+        return self.wood_types.pop(index)
+
+    def swap(self, i, j):
+        self.widths[[i, j]] = self.widths[[j, i]]
+        self.wood_types[i], self.wood_types[j] = self.wood_types[j], self.wood_types[i]
+        self.uids[i], self.uids[j] = self.uids[j], self.uids[i]
+
+    def set_wood_type(self, index, wood_type):
+        self.wood_types[index] = wood_type
+
+    def colors(self):
+        """Return strip colors as hex strings, derived from the wood types"""
+        return [WOOD_TYPES[wood_type] for wood_type in self.wood_types]
+
+    def rgba(self):
+        """Return strip colors as an (N, 4) RGBA array"""
+        return np.array([WOOD_RGBA[wood_type] for wood_type in self.wood_types]).reshape(-1, 4)
+
+def strip_geometry(strips):
+    """Return strip widths, their x offsets (N + 1 values, starting at 0) and label centers"""
+    offsets = np.concatenate(([0.0], np.cumsum(strips.widths)))
+    centers = offsets[:-1] + strips.widths / 2
+    return strips.widths, offsets, centers
+
+def strip_polygons(offsets, height):
+    """Return the corner vertices of each full-height strip as an (N, 4, 2) array"""
+    verts = np.empty((len(offsets) - 1, 4, 2))
+    verts[:, [0, 3], 0] = offsets[:-1, None]
+    verts[:, [1, 2], 0] = offsets[1:, None]
+    verts[:, :2, 1] = 0
+    verts[:, 2:, 1] = height
+    return verts
+
 def calculate_total_width(strips):
     """Calculate total width"""
-    total = sum(strip['width'] for strip in strips)
-    return total
+    return float(strips.widths.sum())
+
+def strips_cache_key(strips):
+    """Build a hashable key of (wood_type, width) pairs for cached drawing functions"""
+    return tuple(zip(strips.wood_types, strips.widths.tolist()))
 
+def strips_from_key(strips_key):
+    """Rebuild the strips described by a strips_cache_key tuple, for read-only use"""
+    return Strips.from_pairs(strips_key, with_uids=False)
+
+# Button callbacks. They run before the next script run, so the change is
+# picked up by that run and no extra st.rerun() is needed.
 def apply_pattern_preset(pattern_name):
     """Apply a pattern preset to the strips"""
     if pattern_name == "Custom Design" or PATTERN_PRESETS[pattern_name] is None:
         return
 
-    pattern = PATTERN_PRESETS[pattern_name]
-    st.session_state.strips = []
+    st.session_state.strips = Strips.from_pairs(PATTERN_PRESETS[pattern_name])
 
-    for wood_type, width in pattern:
-        st.session_state.strips.append({
-            'wood_type': wood_type,
-            'width': width,
-            'color': WOOD_TYPES[wood_type]
-        })
+def duplicate_strip(index):
+    """Insert a copy of a strip right after it"""
+    strips = st.session_state.strips
+    strips.insert(index + 1, strips.wood_types[index], strips.widths[index])
 
-    st.rerun()
+def swap_strips(i, j):
+    st.session_state.strips.swap(i, j)
 
-def add_wood_grain_texture(ax, x, y, width, height, color, orientation='vertical'):
-    """Add wood grain texture effect to a rectangle"""
-    # Create grain lines
-    num_lines = int(width * 5) if orientation == 'vertical' else int(height * 5)
-    for _ in range(num_lines):
-        if orientation == 'vertical':
-            line_x = x + np.random.uniform(0, width)
-            line_y_start = y + np.random.uniform(0, height * 0.2)
-            line_y_end = y + np.random.uniform(height * 0.8, height)
-            ax.plot([line_x, line_x], [line_y_start, line_y_end],
-                   color='black', alpha=0.05, linewidth=0.5)
-        else:
-            line_y = y + np.random.uniform(0, height)
-            line_x_start = x + np.random.uniform(0, width * 0.2)
-            line_x_end = x + np.random.uniform(width * 0.8, width)
-            ax.plot([line_x_start, line_x_end], [line_y, line_y],
-                   color='black', alpha=0.05, linewidth=0.5)
-
-def draw_board_preview(strips, board_width, board_length, show_grain=False, corner_radius=0):
-    """Draw a visual preview of the cutting board"""
-    fig, ax = plt.subplots(figsize=(12, 8))
-
-    current_x = 0
-    for i, strip in enumerate(strips):
-        # Draw the wood strip with optional rounded corners
-        if corner_radius > 0 and (i == 0 or i == len(strips) - 1):
-            # Create rounded rectangle for edge strips
-            from matplotlib.patches import FancyBboxPatch
-            if i == 0:
-                # Left edge - round left side
-                rect = FancyBboxPatch(
-                    (current_x, 0),
-                    strip['width'],
-                    board_length,
-                    boxstyle=f"round,pad=0,rounding_size={corner_radius}",
-                    linewidth=1,
-                    edgecolor='black',
-                    facecolor=strip['color']
-                )
-            else:
-                # Right edge - round right side
-                rect = FancyBboxPatch(
-                    (current_x, 0),
-                    strip['width'],
-                    board_length,
-                    boxstyle=f"round,pad=0,rounding_size={corner_radius}",
-                    linewidth=1,
-                    edgecolor='black',
-                    facecolor=strip['color']
-                )
-        else:
-            rect = patches.Rectangle(
-                (current_x, 0),
-                strip['width'],
-                board_length,
-                linewidth=1,
-                edgecolor='black',
-                facecolor=strip['color']
-            )
-        ax.add_patch(rect)
+def delete_strip(index):
+    st.session_state.strips.pop(index)
 
-        # Add wood grain texture if enabled
-        if show_grain:
-            add_wood_grain_texture(ax, current_x, 0, strip['width'], board_length,
-                                  strip['color'], orientation='vertical')
+def set_all_widths():
+    """Set every strip to the bulk edit width"""
+    st.session_state.strips.widths[:] = st.session_state.bulk_width
+
+def set_all_wood_types():
+    """Set every strip to the bulk edit wood type"""
+    strips = st.session_state.strips
+    for i in range(len(strips)):
+        strips.set_wood_type(i, st.session_state.bulk_wood)
+
+def wood_grain_segments(x, y, width, height, orientation='vertical'):
+    """Return the grain line segments for a rectangle as an (n, 2, 2) array"""
+    num_lines = int(width * 5) if orientation == 'vertical' else int(height * 5)
 
+    # Seed from the rectangle so the same strip always gets the same grain,
+    # and draw all line positions in one batch
+    rng = np.random.default_rng(hash((x, y, width, height, orientation == 'vertical')) & 0xFFFFFFFF)
+    position, start, end = rng.uniform(size=(3, num_lines))
+    start = start * 0.2
+    end = 0.8 + end * 0.2
+
+    if orientation == 'vertical':
+        line_x = x + position * width
+        starts = np.stack([line_x, y + start * height], axis=-1)
+        ends = np.stack([line_x, y + end * height], axis=-1)
+    else:
+        line_y = y + position * height
+        starts = np.stack([x + start * width, line_y], axis=-1)
+        ends = np.stack([x + end * width, line_y], axis=-1)
+    return np.stack([starts, ends], axis=1)
+
+def add_wood_grain_texture(ax, rects, orientation='vertical'):
+    """Add wood grain texture to (x, y, width, height) rectangles as one LineCollection"""
+    segments = [wood_grain_segments(*rect, orientation) for rect in rects]
+    segments = np.concatenate(segments) if segments else []
+    if len(segments):
+        ax.add_collection(LineCollection(segments, colors='black', alpha=0.05, linewidths=0.5))
+
+def _draw_board_preview(strips_key, board_width, board_length, show_grain=False, corner_radius=0):
+    """Draw a visual preview of the cutting board"""
+    strips = strips_from_key(strips_key)
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+
+    # Edge strips get rounded corners, which a PolyCollection can't draw, so
+    # they are added as patches and every other strip goes in one collection
+    square = np.ones(len(strips), dtype=bool)
+    if corner_radius > 0:
+        square[[0, -1]] = False
+
+    widths, offsets, centers = strip_geometry(strips)
+    for i in np.flatnonzero(~square):
+        ax.add_patch(FancyBboxPatch(
+            (offsets[i], 0),
+            widths[i],
+            board_length,
+            boxstyle=f"round,pad=0,rounding_size={corner_radius}",
+            linewidth=1,
+            edgecolor='black',
+            facecolor=WOOD_RGBA[strips.wood_types[i]]
+        ))
+    ax.add_collection(PolyCollection(strip_polygons(offsets, board_length)[square],
+                                     facecolors=strips.rgba()[square],
+                                     edgecolors='black', linewidths=1),
+                      autolim=False)
+
+    # Add wood grain texture for every strip at once if enabled
+    if show_grain:
+        add_wood_grain_texture(ax, [(x, 0, width, board_length)
+                                    for x, width in zip(offsets[:-1].tolist(), widths.tolist())],
+                               orientation='vertical')
+
+    for i, (wood_type, width, color) in enumerate(strips):
         # Add wood type label
         ax.text(
-            current_x + strip['width']/2,
+            centers[i],
             board_length/2,
-            strip['wood_type'],
+            wood_type,
             ha='center',
             va='center',
             fontsize=10,
             rotation=90,
             fontweight='bold',
-            color='white' if strip['wood_type'] in ['Walnut', 'Wenge', 'Purpleheart', 'Bloodwood'] else 'black'
+            color=WOOD_TEXT_COLOR[wood_type]
         )
 
-        current_x += strip['width']
-
     ax.set_xlim(0, board_width)
     ax.set_ylim(0, board_length)
     ax.set_aspect('equal')
@@ -240,43 +380,90 @@ def draw_board_preview(strips, board_width, board_length, show_grain=False, corn
 
     return fig
 
-def draw_end_grain_preview(strips, board_width, board_length, show_grain=False):
-    """Draw end grain pattern (rotated 90 degrees)"""
-    fig, ax = plt.subplots(figsize=(12, 8))
-
-    # For end grain, we show the strips as horizontal bands
-    current_y = 0
-    for i, strip in enumerate(strips):
-        rect = patches.Rectangle(
-            (0, current_y),
-            board_length,  # Length becomes the horizontal dimension
-            strip['width'],  # Width becomes the vertical dimension
-            linewidth=1,
-            edgecolor='black',
-            facecolor=strip['color']
-        )
-        ax.add_patch(rect)
+# Display height of the SVG edge grain preview, in pixels
+SVG_PREVIEW_HEIGHT = 560
+
+@st.cache_data(max_entries=32, ttl="1h", show_spinner=False)
+def render_board_svg(strips_key, board_width, board_length, show_grain=False, corner_radius=0):
+    """Render the edge grain preview as SVG markup, drawn in board inches"""
+    strips = strips_from_key(strips_key)
+    widths, offsets, centers = strip_geometry(strips)
+    last = len(strips) - 1
+    font_size = board_length / 45
+    stroke = 'vector-effect="non-scaling-stroke"'
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {board_width:g} {board_length:g}" '
+        f'height="{SVG_PREVIEW_HEIGHT}" width="{SVG_PREVIEW_HEIGHT * board_width / board_length:.0f}">',
+        # Outline of the full board, so unused width stays visible
+        f'<rect width="{board_width:g}" height="{board_length:g}" fill="none" stroke="#999" '
+        f'stroke-dasharray="4 4" {stroke}/>'
+    ]
+    for i, (wood_type, width, color) in enumerate(strips):
+        # Edge strips get rounded corners, like the matplotlib preview
+        radius = corner_radius if i in (0, last) else 0
+        parts.append(f'<rect x="{offsets[i]:g}" width="{width:g}" height="{board_length:g}" '
+                     f'rx="{radius:g}" fill="{color}" stroke="black" {stroke}/>')
 
-        # Add wood grain texture if enabled (horizontal for end grain)
         if show_grain:
-            add_wood_grain_texture(ax, 0, current_y, board_length, strip['width'],
-                                  strip['color'], orientation='horizontal')
+            # SVG y runs downward, so flip the grain segments vertically
+            segments = wood_grain_segments(offsets[i], 0, width, board_length, orientation='vertical')
+            path = ''.join(f'M{x0:.3f} {board_length - y0:.3f}L{x1:.3f} {board_length - y1:.3f}'
+                           for (x0, y0), (x1, y1) in segments.tolist())
+            parts.append(f'<path d="{path}" stroke="black" stroke-opacity="0.05" stroke-width="0.5" {stroke}/>')
+
+    for i, (wood_type, width, color) in enumerate(strips):
+        x, y = centers[i], board_length / 2
+        parts.append(f'<text x="{x:g}" y="{y:g}" transform="rotate(-90 {x:g} {y:g})" '
+                     f'text-anchor="middle" dominant-baseline="central" font-family="sans-serif" '
+                     f'font-size="{font_size:g}" font-weight="bold" fill="{WOOD_TEXT_COLOR[wood_type]}">'
+                     f'{wood_type}</text>')
+
+    parts.append('</svg>')
+    return ''.join(parts)
+
+def _draw_end_grain_preview(strips_key, board_width, board_length, show_grain=False):
+    """Draw end grain pattern (rotated 90 degrees)"""
+    strips = strips_from_key(strips_key)
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+
+    # For end grain, we show the strips as horizontal bands: a single-column
+    # mesh whose row edges are the strip offsets, with one color per row.
+    # Length becomes the horizontal dimension and width the vertical one.
+    widths, offsets, centers = strip_geometry(strips)
+    ax.pcolormesh(
+        [0, board_length],
+        offsets,
+        np.arange(len(strips))[:, None],
+        cmap=ListedColormap(strips.rgba()),
+        vmin=-0.5,
+        vmax=len(strips) - 0.5,
+        edgecolors='black',
+        linewidth=1,
+        antialiased=True
+    )
 
+    # Add wood grain texture for every strip at once if enabled (horizontal for end grain)
+    if show_grain:
+        add_wood_grain_texture(ax, [(0, y, board_length, width)
+                                    for y, width in zip(offsets[:-1].tolist(), widths.tolist())],
+                               orientation='horizontal')
+
+    for i, (wood_type, width, color) in enumerate(strips):
         # Add wood type label
         ax.text(
             board_length/2,
-            current_y + strip['width']/2,
-            strip['wood_type'],
+            centers[i],
+            wood_type,
             ha='center',
             va='center',
             fontsize=10,
             rotation=0,
             fontweight='bold',
-            color='white' if strip['wood_type'] in ['Walnut', 'Wenge', 'Purpleheart', 'Bloodwood'] else 'black'
+            color=WOOD_TEXT_COLOR[wood_type]
         )
 
-        current_y += strip['width']
-
     ax.set_xlim(0, board_length)
     ax.set_ylim(0, board_width)
     ax.set_aspect('equal')
@@ -287,43 +474,40 @@ def draw_end_grain_preview(strips, board_width, board_length, show_grain=False):
 
     return fig
 
-def draw_3d_preview(strips, board_width, board_length, board_thickness=1.5):
+# Vertex indices of the 6 faces of a box whose 8 vertices are ordered bottom then top
+BOX_FACE_INDICES = np.array([
+    [0, 1, 5, 4],  # Front
+    [2, 3, 7, 6],  # Back
+    [0, 3, 7, 4],  # Left
+    [1, 2, 6, 5],  # Right
+    [0, 1, 2, 3],  # Bottom
+    [4, 5, 6, 7]   # Top
+])
+
+def _draw_3d_preview(strips_key, board_width, board_length, board_thickness=1.5, elev=20, azim=45):
     """Draw a 3D preview of the cutting board"""
-    fig = plt.figure(figsize=(12, 8))
+    strips = strips_from_key(strips_key)
+    fig = Figure(figsize=(12, 8))
     ax = fig.add_subplot(111, projection='3d')
 
-    current_x = 0
-    for strip in strips:
-        # Define the 6 faces of the rectangular strip
-        x = current_x
-        y = 0
-        z = 0
-        w = strip['width']
-        l = board_length
-        h = board_thickness
-
-        # Vertices of the box
-        vertices = [
-            [x, y, z], [x+w, y, z], [x+w, y+l, z], [x, y+l, z],  # Bottom face
-            [x, y, z+h], [x+w, y, z+h], [x+w, y+l, z+h], [x, y+l, z+h]  # Top face
-        ]
-
-        # Define the 6 faces using vertex indices
-        faces = [
-            [vertices[0], vertices[1], vertices[5], vertices[4]],  # Front
-            [vertices[2], vertices[3], vertices[7], vertices[6]],  # Back
-            [vertices[0], vertices[3], vertices[7], vertices[4]],  # Left
-            [vertices[1], vertices[2], vertices[6], vertices[5]],  # Right
-            [vertices[0], vertices[1], vertices[2], vertices[3]],  # Bottom
-            [vertices[4], vertices[5], vertices[6], vertices[7]]   # Top
-        ]
-
-        # Create the 3D polygon collection
-        face_collection = Poly3DCollection(faces, alpha=0.9, linewidths=1, edgecolors='black')
-        face_collection.set_facecolor(strip['color'])
-        ax.add_collection3d(face_collection)
-
-        current_x += strip['width']
+    # Build every strip's box at once: (N, 8, 3) vertices -> (6N, 4, 3) faces
+    widths, offsets, _ = strip_geometry(strips)
+    x0 = offsets[:-1]
+    x1 = offsets[1:]
+    corner_x = np.stack([x0, x1, x1, x0], axis=1)
+    corner_y = np.array([0.0, 0.0, board_length, board_length])
+    vertices = np.empty((len(strips), 8, 3))
+    vertices[:, :4, 0] = vertices[:, 4:, 0] = corner_x  # Bottom and top faces
+    vertices[:, :4, 1] = vertices[:, 4:, 1] = corner_y
+    vertices[:, :4, 2] = 0
+    vertices[:, 4:, 2] = board_thickness
+    faces = vertices[:, BOX_FACE_INDICES].reshape(-1, 4, 3)
+    facecolors = np.repeat(strips.rgba(), len(BOX_FACE_INDICES), axis=0)
+
+    # Create a single 3D polygon collection for all strips
+    face_collection = Poly3DCollection(faces, facecolors=facecolors, alpha=0.9,
+                                       linewidths=1, edgecolors='black')
+    ax.add_collection3d(face_collection)
 
     # Set the aspect ratio and labels
     ax.set_xlim(0, board_width)
@@ -338,7 +522,7 @@ def draw_3d_preview(strips, board_width, board_length, board_thickness=1.5):
     ax.set_box_aspect([board_width, board_length, board_thickness])
 
     # Set viewing angle
-    ax.view_init(elev=20, azim=45)
+    ax.view_init(elev=elev, azim=azim)
 
     return fig
 
@@ -346,13 +530,13 @@ def draw_interactive_3d_preview(strips, board_width, board_length, board_thickne
     """Draw an interactive 3D preview using Plotly that can be rotated with mouse"""
     fig = go.Figure()
 
-    current_x = 0
-    for strip in strips:
+    widths, offsets, _ = strip_geometry(strips)
+    for i, (wood_type, width, color) in enumerate(strips):
         # Define the 8 vertices of the box
-        x = current_x
+        x = offsets[i]
         y = 0
         z = 0
-        w = strip['width']
+        w = width
         l = board_length
         h = board_thickness
 
@@ -381,19 +565,17 @@ def draw_interactive_3d_preview(strips, board_width, board_length, board_thickne
                 x=face_vertices[:, 0],
                 y=face_vertices[:, 1],
                 z=face_vertices[:, 2],
-                color=strip['color'],
+                color=color,
                 opacity=0.95,
                 flatshading=True,
                 showlegend=False,
                 hoverinfo='text',
-                text=f"{strip['wood_type']}<br>Width: {strip['width']}\"",
+                text=f"{wood_type}<br>Width: {width}\"",
                 i=[0, 0],
                 j=[1, 2],
                 k=[2, 3]
             ))
 
-        current_x += strip['width']
-
     # Update layout for better visualization
     fig.update_layout(
         title=f'Interactive 3D Preview - Thickness: {board_thickness}" (Click and drag to rotate)',
@@ -412,63 +594,71 @@ def draw_interactive_3d_preview(strips, board_width, board_length, board_thickne
 
     return fig
 
-def draw_schematic(strips, board_width, board_length):
+# Rounded white box behind the schematic's strip labels
+SCHEMATIC_LABEL_BBOX = dict(boxstyle='round', facecolor='white', alpha=0.8)
+
+def _draw_schematic(strips_key, board_width, board_length):
     """Draw a dimensioned schematic for cutting"""
-    fig, ax = plt.subplots(figsize=(14, 10))
-
-    current_x = 0
-    for i, strip in enumerate(strips):
-        # Draw the strip outline
-        rect = patches.Rectangle(
-            (current_x, 0),
-            strip['width'],
-            board_length,
-            linewidth=2,
-            edgecolor='black',
-            facecolor=strip['color'],
-            alpha=0.7
-        )
-        ax.add_patch(rect)
+    strips = strips_from_key(strips_key)
+    fig = Figure(figsize=(14, 10))
+    ax = fig.subplots()
 
+    widths, offsets, centers = strip_geometry(strips)
+    dimension_y = board_length + 1
+
+    # Draw every strip outline as a single collection; the axes limits are set
+    # explicitly below, so skip the per-patch data limit update
+    ax.add_collection(PolyCollection(strip_polygons(offsets, board_length), facecolors=strips.rgba(),
+                                     edgecolors='black', linewidths=2, alpha=0.7),
+                      autolim=False)
+
+    for i, (wood_type, width, color) in enumerate(strips):
         # Add wood type and width label inside strip
         ax.text(
-            current_x + strip['width']/2,
+            centers[i],
             board_length/2,
-            f"{strip['wood_type']}\n{strip['width']}\"",
+            f"{wood_type}\n{width}\"",
             ha='center',
             va='center',
             fontsize=11,
             fontweight='bold',
-            bbox=dict(boxstyle='round', facecolor='white', alpha=0.8)
+            bbox=SCHEMATIC_LABEL_BBOX
         )
 
-        # Add dimension line above
-        dimension_y = board_length + 1
-        ax.plot([current_x, current_x + strip['width']],
-                [dimension_y, dimension_y], 'k-', linewidth=1.5)
-        ax.plot([current_x, current_x],
-                [dimension_y - 0.2, dimension_y + 0.2], 'k-', linewidth=1.5)
-        ax.plot([current_x + strip['width'], current_x + strip['width']],
-                [dimension_y - 0.2, dimension_y + 0.2], 'k-', linewidth=1.5)
-        ax.text(current_x + strip['width']/2, dimension_y + 0.5,
-                f'{strip["width"]}"', ha='center', fontsize=10, fontweight='bold')
+        # Add dimension label above
+        ax.text(centers[i], dimension_y + 0.5,
+                f'{width}"', ha='center', fontsize=10, fontweight='bold')
 
-        current_x += strip['width']
+    # Dimension line above each strip: a horizontal line plus a tick at each end
+    strip_segments = np.empty((len(strips), 3, 2, 2))
+    strip_segments[:, 0, :, 0] = np.column_stack([offsets[:-1], offsets[1:]])
+    strip_segments[:, 0, :, 1] = dimension_y
+    strip_segments[:, 1, :, 0] = offsets[:-1, None]
+    strip_segments[:, 2, :, 0] = offsets[1:, None]
+    strip_segments[:, 1:, :, 1] = [dimension_y - 0.2, dimension_y + 0.2]
 
     # Add overall dimensions
-    total_width = calculate_total_width(strips)
+    total_width = offsets[-1]
+    overall_segments = np.array([
+        # Right side dimension line
+        [[total_width + 1, 0], [total_width + 1, board_length]],
+        [[total_width + 0.8, 0], [total_width + 1.2, 0]],
+        [[total_width + 0.8, board_length], [total_width + 1.2, board_length]],
+        # Bottom dimension line
+        [[0, -1], [total_width, -1]],
+        [[0, -1.2], [0, -0.8]],
+        [[total_width, -1.2], [total_width, -0.8]]
+    ])
+
+    # Draw every dimension line as a single collection
+    ax.add_collection(LineCollection(
+        np.concatenate([strip_segments.reshape(-1, 2, 2), overall_segments]),
+        colors='black',
+        linewidths=[1.5] * (3 * len(strips)) + [2] * len(overall_segments)
+    ), autolim=False)
 
-    # Right side dimension line
-    ax.plot([total_width + 1, total_width + 1], [0, board_length], 'k-', linewidth=2)
-    ax.plot([total_width + 0.8, total_width + 1.2], [0, 0], 'k-', linewidth=2)
-    ax.plot([total_width + 0.8, total_width + 1.2], [board_length, board_length], 'k-', linewidth=2)
     ax.text(total_width + 1.5, board_length/2, f'{board_length}"',
             ha='left', va='center', fontsize=12, fontweight='bold', rotation=270)
-
-    # Bottom dimension line
-    ax.plot([0, total_width], [-1, -1], 'k-', linewidth=2)
-    ax.plot([0, 0], [-1.2, -0.8], 'k-', linewidth=2)
-    ax.plot([total_width, total_width], [-1.2, -0.8], 'k-', linewidth=2)
     ax.text(total_width/2, -1.5, f'Total: {total_width:.3f}"',
             ha='center', fontsize=12, fontweight='bold')
 
@@ -481,13 +671,52 @@ def draw_schematic(strips, board_width, board_length):
     # Add cut list
     cut_list_y = -2.5
     ax.text(-1.5, cut_list_y, 'CUT LIST:', fontsize=11, fontweight='bold')
-    for i, strip in enumerate(strips):
-        ax.text(-1.5, cut_list_y - 0.5 * (i + 1),
-                f'{i+1}. {strip["wood_type"]}: {strip["width"]}" × {board_length}"',
-                fontsize=9)
+    cut_list = '\n'.join(f'{i+1}. {wood_type}: {width}" × {board_length}"'
+                         for i, (wood_type, width, color) in enumerate(strips))
+    ax.text(-1.5, cut_list_y - 0.25, cut_list, fontsize=9, va='top')
 
     return fig
 
+# On-screen previews are rendered at screen resolution; print quality is
+# reserved for the downloaded files
+PREVIEW_DPI = 100
+DOWNLOAD_DPI = 300
+
+# Drawing functions by figure kind, used to render preview and download images
+FIGURE_DRAWERS = {
+    'edge_grain': _draw_board_preview,
+    'end_grain': _draw_end_grain_preview,
+    '3d': _draw_3d_preview,
+    'schematic': _draw_schematic,
+}
+
+@st.cache_data(max_entries=16, ttl="1h", show_spinner=False)
+def render_image(kind, strips_key, board_width, board_length, fmt='png', dpi=DOWNLOAD_DPI, **options):
+    """Render a figure to PNG/PDF bytes, computed once per distinct design"""
+    fig = FIGURE_DRAWERS[kind](strips_key, board_width, board_length, **options)
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt, dpi=dpi, bbox_inches='tight')
+    return buf.getvalue()
+
+@st.cache_data(max_entries=16, ttl="1h", show_spinner=False)
+def serialize_design(strips_key, board_width, board_length, design_name):
+    """Serialize a design to indented JSON bytes, computed once per distinct design"""
+    design_data = {
+        'design_name': design_name,
+        'board_width': board_width,
+        'board_length': board_length,
+        'strips': strips_from_key(strips_key).to_records()
+    }
+    if orjson is not None:
+        return orjson.dumps(design_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(design_data, indent=2).encode()
+
+def load_design(data):
+    """Parse saved design JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Streamlit App
 st.set_page_config(page_title="Cutting Board Designer", layout="wide")
 st.title("🪵 Wood Cutting Board Designer")
@@ -498,11 +727,11 @@ st.sidebar.header("Design Controls")
 
 # Initialize session state
 if 'strips' not in st.session_state:
-    st.session_state.strips = [
-        {'wood_type': 'Maple', 'width': 2.0, 'color': WOOD_TYPES['Maple']},
-        {'wood_type': 'Walnut', 'width': 1.5, 'color': WOOD_TYPES['Walnut']},
-        {'wood_type': 'Maple', 'width': 2.0, 'color': WOOD_TYPES['Maple']},
-    ]
+    st.session_state.strips = Strips.from_pairs([
+        ('Maple', 2.0),
+        ('Walnut', 1.5),
+        ('Maple', 2.0),
+    ])
 if 'history' not in st.session_state:
     st.session_state.history = []
     st.session_state.history_index = -1
@@ -521,14 +750,11 @@ unit = st.sidebar.radio(
 )
 st.session_state.unit = unit
 
-# Unit display helper
+# Unit display helper, with the unit's scale and format resolved once per rerun
+unit_scale, unit_format, unit_suffix = UNIT_FORMATS[unit]
+
 def format_dimension(value_in_inches):
-    if st.session_state.unit == "centimeters":
-        return f"{inches_to_cm(value_in_inches):.2f} cm"
-    elif st.session_state.unit == "millimeters":
-        return f"{inches_to_mm(value_in_inches):.1f} mm"
-    else:
-        return f"{value_in_inches:.3f}\""
+    return f"{value_in_inches * unit_scale:{unit_format}}{unit_suffix}"
 
 st.sidebar.markdown("---")
 
@@ -536,7 +762,7 @@ st.sidebar.markdown("---")
 st.sidebar.subheader("Board Size")
 size_preset = st.sidebar.selectbox(
     "Size Preset",
-    options=list(BOARD_PRESETS.keys()),
+    options=BOARD_PRESET_NAMES,
     index=2  # Default to "Standard (12" × 18")"
 )
 
@@ -572,13 +798,13 @@ st.sidebar.markdown("---")
 st.sidebar.subheader("Pattern Presets")
 selected_pattern = st.sidebar.selectbox(
     "Choose a Pattern",
-    options=list(PATTERN_PRESETS.keys()),
+    options=PATTERN_PRESET_NAMES,
     index=0,
     help="Select a pre-designed pattern to get started quickly"
 )
 
-if st.sidebar.button("🎨 Apply Pattern", use_container_width=True):
-    apply_pattern_preset(selected_pattern)
+st.sidebar.button("🎨 Apply Pattern", width="stretch",
+                  on_click=apply_pattern_preset, args=(selected_pattern,))
 
 # Show pattern preview info
 if selected_pattern != "Custom Design" and PATTERN_PRESETS[selected_pattern] is not None:
@@ -599,11 +825,7 @@ num_strips = st.sidebar.number_input(
 
 # Adjust strips list if needed
 while len(st.session_state.strips) < num_strips:
-    st.session_state.strips.append({
-        'wood_type': 'Maple',
-        'width': 1.0,
-        'color': WOOD_TYPES['Maple']
-    })
+    st.session_state.strips.append('Maple', 1.0)
 while len(st.session_state.strips) > num_strips:
     st.session_state.strips.pop()
 
@@ -612,7 +834,7 @@ st.sidebar.subheader("Strip Tools")
 
 # Bulk edit option
 with st.sidebar.expander("⚙️ Bulk Edit"):
-    bulk_width = st.number_input(
+    st.number_input(
         "Set all widths to:",
         min_value=0.25,
         max_value=float(board_width),
@@ -620,88 +842,67 @@ with st.sidebar.expander("⚙️ Bulk Edit"):
         step=0.25,
         key="bulk_width"
     )
-    if st.button("Apply to All Strips"):
-        for strip in st.session_state.strips:
-            strip['width'] = bulk_width
-        st.rerun()
+    st.button("Apply to All Strips", on_click=set_all_widths)
 
-    bulk_wood = st.selectbox(
+    st.selectbox(
         "Set all wood types to:",
-        options=list(WOOD_TYPES.keys()),
+        options=WOOD_TYPE_NAMES,
         key="bulk_wood"
     )
-    if st.button("Apply Wood to All"):
-        for strip in st.session_state.strips:
-            strip['wood_type'] = bulk_wood
-            strip['color'] = WOOD_TYPES[bulk_wood]
-        st.rerun()
+    st.button("Apply Wood to All", on_click=set_all_wood_types)
 
 st.sidebar.markdown("---")
 st.sidebar.subheader("Configure Each Strip")
 
-# Configure each strip
-for i in range(num_strips):
-    st.sidebar.markdown(f"**Strip {i+1}**")
-
-    col1, col2 = st.sidebar.columns(2)
+# Configure each strip in one editable table. It sits in a form so edits to
+# several strips are applied together in one rerun when the form is submitted.
+# The table has no key: its identity follows the strip data, so it starts
+# fresh whenever the strips change.
+strips = st.session_state.strips
+with st.sidebar.form("strip_config"):
+    edited = st.data_editor(
+        {"Wood": strips.wood_types, "Width (in)": strips.widths.tolist()},
+        column_config={
+            "Wood": st.column_config.SelectboxColumn(options=WOOD_TYPE_NAMES, required=True),
+            "Width (in)": st.column_config.NumberColumn(
+                min_value=0.25, max_value=float(board_width), step=0.25, required=True
+            ),
+        },
+        num_rows="fixed",
+        width="stretch"
+    )
+    st.form_submit_button("✅ Apply Strip Changes", width="stretch")
 
-    with col1:
-        # Use the strip's unique ID to ensure stable widgets
-        current_strip = st.session_state.strips[i]
-        wood_type = st.selectbox(
-            "Wood",
-            options=list(WOOD_TYPES.keys()),
-            key=f"wood_{i}_{id(current_strip)}",
-            index=list(WOOD_TYPES.keys()).index(current_strip['wood_type'])
-        )
-        current_strip['wood_type'] = wood_type
-        current_strip['color'] = WOOD_TYPES[wood_type]
+for i, (wood_type, width) in enumerate(zip(edited["Wood"], edited["Width (in)"])):
+    strips.set_wood_type(i, wood_type)
+    strips.widths[i] = width
 
-    with col2:
-        width = st.number_input(
-            "Width (in)",
-            min_value=0.25,
-            max_value=float(board_width),
-            value=float(current_strip['width']),
-            step=0.25,
-            key=f"width_{i}_{id(current_strip)}"
-        )
-        current_strip['width'] = width
+# Strip action buttons, which can't live inside the form
+st.sidebar.markdown("**Reorder / Duplicate / Delete**")
+for i in range(num_strips):
+    uid = strips.uids[i]
+    st.sidebar.caption(f"Strip {i+1}: {strips.wood_types[i]}, {format_dimension(strips.widths[i])}")
 
-    # Strip action buttons
     col_a, col_b, col_c, col_d = st.sidebar.columns(4)
 
     with col_a:
-        if st.button("📋", key=f"duplicate_{i}_{id(current_strip)}", help="Duplicate this strip"):
-            new_strip = copy.deepcopy(current_strip)
-            st.session_state.strips.insert(i + 1, new_strip)
-            st.rerun()
+        st.button("📋", key=f"duplicate_{uid}", help="Duplicate this strip",
+                  on_click=duplicate_strip, args=(i,))
 
     with col_b:
         # Show button but disable if it's the first strip
-        if st.button("⬆️", key=f"up_{i}_{id(current_strip)}", help="Move up", disabled=(i == 0)):
-            # Swap with previous strip - create temp copy to avoid reference issues
-            temp = st.session_state.strips[i-1]
-            st.session_state.strips[i-1] = st.session_state.strips[i]
-            st.session_state.strips[i] = temp
-            st.rerun()
+        st.button("⬆️", key=f"up_{uid}", help="Move up", disabled=(i == 0),
+                  on_click=swap_strips, args=(i - 1, i))
 
     with col_c:
         # Show button but disable if it's the last strip
-        if st.button("⬇️", key=f"down_{i}_{id(current_strip)}", help="Move down", disabled=(i == num_strips - 1)):
-            # Swap with next strip - create temp copy to avoid reference issues
-            temp = st.session_state.strips[i+1]
-            st.session_state.strips[i+1] = st.session_state.strips[i]
-            st.session_state.strips[i] = temp
-            st.rerun()
+        st.button("⬇️", key=f"down_{uid}", help="Move down", disabled=(i == num_strips - 1),
+                  on_click=swap_strips, args=(i, i + 1))
 
     with col_d:
         # Show button but disable if it's the only strip
-        if st.button("🗑️", key=f"delete_{i}_{id(current_strip)}", help="Delete this strip", disabled=(num_strips == 1)):
-            st.session_state.strips.pop(i)
-            st.rerun()
-
-    st.sidebar.markdown("")
+        st.button("🗑️", key=f"delete_{uid}", help="Delete this strip", disabled=(num_strips == 1),
+                  on_click=delete_strip, args=(i,))
 
 # Calculate total width
 total_width = calculate_total_width(st.session_state.strips)
@@ -734,16 +935,8 @@ st.session_state.design_name = st.sidebar.text_input(
 )
 
 # Export design as JSON
-import json
-
-design_data = {
-    'design_name': st.session_state.design_name,
-    'board_width': board_width,
-    'board_length': board_length,
-    'strips': st.session_state.strips
-}
-
-design_json = json.dumps(design_data, indent=2)
+design_json = serialize_design(strips_cache_key(st.session_state.strips), board_width, board_length,
+                               st.session_state.design_name)
 st.sidebar.download_button(
     label="💾 Save Design (JSON)",
     data=design_json,
@@ -755,8 +948,9 @@ st.sidebar.download_button(
 uploaded_file = st.sidebar.file_uploader("📂 Load Design", type=['json'])
 if uploaded_file is not None:
     try:
-        loaded_data = json.load(uploaded_file)
-        st.session_state.strips = loaded_data.get('strips', st.session_state.strips)
+        loaded_data = load_design(uploaded_file.getvalue())
+        if 'strips' in loaded_data:
+            st.session_state.strips = Strips.from_records(loaded_data['strips'])
         st.session_state.design_name = loaded_data.get('design_name', 'cutting_board_design')
         st.success("Design loaded successfully!")
         st.rerun()
@@ -779,130 +973,142 @@ with col_opt3:
 with col_opt4:
     view_angle = st.selectbox("3D View Angle", ["Default (45°)", "Top (90°)", "Side (0°)", "Angled (30°)"])
 
-# Main content area
-tab1, tab2, tab3, tab4 = st.tabs(["📊 Edge Grain", "🔄 End Grain", "📦 3D View", "📐 Schematic"])
+# Hashable design key shared by the cached renderers below
+strips_key = strips_cache_key(st.session_state.strips)
 
-with tab1:
+# Check once whether the strips fit the board (with a small tolerance for float
+# sums); oversized designs skip the views entirely and never enter the caches
+design_fits = total_width <= board_width + 1e-9
+
+# Each view is a fragment, so clicking one of its download buttons reruns only
+# that view instead of the whole app
+@st.fragment
+def edge_grain_view(strips_key, board_width, board_length, show_grain, corner_radius):
     st.subheader("Edge Grain Preview")
-    if total_width <= board_width:
-        fig_preview = draw_board_preview(st.session_state.strips, board_width, board_length,
-                                         show_grain=show_grain, corner_radius=corner_radius)
-        st.pyplot(fig_preview)
-
-        # Download preview
-        buf = io.BytesIO()
-        fig_preview.savefig(buf, format='png', dpi=300, bbox_inches='tight')
-        buf.seek(0)
-        st.download_button(
-            label="📥 Download Edge Grain Preview (PNG)",
-            data=buf,
-            file_name=f"{st.session_state.design_name}_edge_grain.png",
-            mime="image/png"
-        )
-    else:
-        st.error("Total width exceeds board width! Please adjust strip widths.")
+    # Preview as SVG in the browser; matplotlib is only used for the PNG download
+    st.image(render_board_svg(strips_key, board_width, board_length, show_grain, corner_radius),
+             caption=f"Board: {format_dimension(board_width)} × {format_dimension(board_length)}")
+
+    # Download preview, rendered at full resolution only when clicked
+    st.download_button(
+        label="📥 Download Edge Grain Preview (PNG)",
+        data=partial(render_image, 'edge_grain', strips_key, board_width, board_length,
+                     show_grain=show_grain, corner_radius=corner_radius),
+        file_name=f"{st.session_state.design_name}_edge_grain.png",
+        mime="image/png"
+    )
 
-with tab2:
+@st.fragment
+def end_grain_view(strips_key, board_width, board_length, show_grain):
     st.subheader("End Grain Preview")
     st.info("This shows how the board would look if cut and rotated 90° for an end grain pattern")
-    if total_width <= board_width:
-        fig_end_grain = draw_end_grain_preview(st.session_state.strips, board_width, board_length,
-                                                show_grain=show_grain)
-        st.pyplot(fig_end_grain)
-
-        # Download end grain preview
-        buf = io.BytesIO()
-        fig_end_grain.savefig(buf, format='png', dpi=300, bbox_inches='tight')
-        buf.seek(0)
-        st.download_button(
-            label="📥 Download End Grain Preview (PNG)",
-            data=buf,
-            file_name=f"{st.session_state.design_name}_end_grain.png",
-            mime="image/png"
-        )
-    else:
-        st.error("Total width exceeds board width! Please adjust strip widths.")
+    st.image(render_image('end_grain', strips_key, board_width, board_length, dpi=PREVIEW_DPI,
+                          show_grain=show_grain),
+             width="stretch")
+
+    # Download end grain preview, rendered at full resolution only when clicked
+    st.download_button(
+        label="📥 Download End Grain Preview (PNG)",
+        data=partial(render_image, 'end_grain', strips_key, board_width, board_length,
+                     show_grain=show_grain),
+        file_name=f"{st.session_state.design_name}_end_grain.png",
+        mime="image/png"
+    )
 
-with tab3:
+@st.fragment
+def three_d_view(strips, strips_key, board_width, board_length, board_thickness, view_angle):
     st.subheader("3D Preview")
     st.info("💡 Click and drag to rotate the 3D view. Use scroll to zoom. Right-click and drag to pan.")
 
-    if total_width <= board_width:
-        # Create interactive Plotly 3D view
-        fig_interactive = draw_interactive_3d_preview(st.session_state.strips, board_width, board_length, board_thickness)
-
-        # Adjust camera angle based on selection
+    # Create interactive Plotly 3D view
+    fig_interactive = draw_interactive_3d_preview(strips, board_width, board_length, board_thickness)
+
+    # Adjust camera angle based on selection
+    if view_angle == "Top (90°)":
+        fig_interactive.update_layout(scene_camera=dict(eye=dict(x=0, y=0, z=2.5)))
+    elif view_angle == "Side (0°)":
+        fig_interactive.update_layout(scene_camera=dict(eye=dict(x=0, y=2.5, z=0)))
+    elif view_angle == "Angled (30°)":
+        fig_interactive.update_layout(scene_camera=dict(eye=dict(x=1.8, y=1.8, z=0.6)))
+    else:  # Default
+        fig_interactive.update_layout(scene_camera=dict(eye=dict(x=1.5, y=1.5, z=0.8)))
+
+    # Display the interactive plot
+    st.plotly_chart(fig_interactive, width="stretch")
+
+    # Still offer static matplotlib version for download
+    with st.expander("📥 Download Static 3D Image"):
+        # Adjust viewing angle for static version
         if view_angle == "Top (90°)":
-            fig_interactive.update_layout(scene_camera=dict(eye=dict(x=0, y=0, z=2.5)))
+            elev, azim = 90, 0
         elif view_angle == "Side (0°)":
-            fig_interactive.update_layout(scene_camera=dict(eye=dict(x=0, y=2.5, z=0)))
+            elev, azim = 0, 0
         elif view_angle == "Angled (30°)":
-            fig_interactive.update_layout(scene_camera=dict(eye=dict(x=1.8, y=1.8, z=0.6)))
+            elev, azim = 30, 60
         else:  # Default
-            fig_interactive.update_layout(scene_camera=dict(eye=dict(x=1.5, y=1.5, z=0.8)))
-
-        # Display the interactive plot
-        st.plotly_chart(fig_interactive, use_container_width=True)
-
-        # Still offer static matplotlib version for download
-        with st.expander("📥 Download Static 3D Image"):
-            fig_3d_static = draw_3d_preview(st.session_state.strips, board_width, board_length, board_thickness)
-
-            # Adjust viewing angle for static version
-            ax_3d = fig_3d_static.axes[0]
-            if view_angle == "Top (90°)":
-                ax_3d.view_init(elev=90, azim=0)
-            elif view_angle == "Side (0°)":
-                ax_3d.view_init(elev=0, azim=0)
-            elif view_angle == "Angled (30°)":
-                ax_3d.view_init(elev=30, azim=60)
-            else:  # Default
-                ax_3d.view_init(elev=20, azim=45)
-
-            st.pyplot(fig_3d_static)
-
-            # Download 3D preview
-            buf = io.BytesIO()
-            fig_3d_static.savefig(buf, format='png', dpi=300, bbox_inches='tight')
-            buf.seek(0)
-            st.download_button(
-                label="📥 Download 3D Preview (PNG)",
-                data=buf,
-                file_name=f"{st.session_state.design_name}_3d.png",
-                mime="image/png"
-            )
-    else:
-        st.error("Total width exceeds board width! Please adjust strip widths.")
+            elev, azim = 20, 45
 
-with tab4:
-    st.subheader("Dimensioned Schematic")
-    if total_width <= board_width:
-        fig_schematic = draw_schematic(st.session_state.strips, board_width, board_length)
-        st.pyplot(fig_schematic)
-
-        # Download schematic as PDF
-        buf_pdf = io.BytesIO()
-        fig_schematic.savefig(buf_pdf, format='pdf', bbox_inches='tight')
-        buf_pdf.seek(0)
-        st.download_button(
-            label="📥 Download Schematic (PDF)",
-            data=buf_pdf,
-            file_name=f"{st.session_state.design_name}_schematic.pdf",
-            mime="application/pdf"
-        )
+        st.image(render_image('3d', strips_key, board_width, board_length, dpi=PREVIEW_DPI,
+                              board_thickness=board_thickness, elev=elev, azim=azim),
+                 width="stretch")
 
-        # Download schematic as PNG
-        buf_png = io.BytesIO()
-        fig_schematic.savefig(buf_png, format='png', dpi=300, bbox_inches='tight')
-        buf_png.seek(0)
+        # Download 3D preview, rendered at full resolution only when clicked
         st.download_button(
-            label="📥 Download Schematic (PNG)",
-            data=buf_png,
-            file_name=f"{st.session_state.design_name}_schematic.png",
+            label="📥 Download 3D Preview (PNG)",
+            data=partial(render_image, '3d', strips_key, board_width, board_length,
+                         board_thickness=board_thickness, elev=elev, azim=azim),
+            file_name=f"{st.session_state.design_name}_3d.png",
             mime="image/png"
         )
-    else:
-        st.error("Total width exceeds board width! Please adjust strip widths.")
+
+@st.fragment
+def schematic_view(strips_key, board_width, board_length):
+    st.subheader("Dimensioned Schematic")
+    st.image(render_image('schematic', strips_key, board_width, board_length, dpi=PREVIEW_DPI),
+             width="stretch")
+
+    # Download schematic as PDF, rendered only when clicked
+    st.download_button(
+        label="📥 Download Schematic (PDF)",
+        data=partial(render_image, 'schematic', strips_key, board_width, board_length,
+                     fmt='pdf', dpi=None),
+        file_name=f"{st.session_state.design_name}_schematic.pdf",
+        mime="application/pdf"
+    )
+
+    # Download schematic as PNG, rendered at full resolution only when clicked
+    st.download_button(
+        label="📥 Download Schematic (PNG)",
+        data=partial(render_image, 'schematic', strips_key, board_width, board_length),
+        file_name=f"{st.session_state.design_name}_schematic.png",
+        mime="image/png"
+    )
+
+# Main content area
+if not design_fits:
+    st.error("Total width exceeds board width! Please adjust strip widths.")
+
+# Tabs track the active selection so only the visible tab is computed on each
+# rerun. They are always rendered so the selected tab survives a too-wide design.
+tab1, tab2, tab3, tab4 = st.tabs(["📊 Edge Grain", "🔄 End Grain", "📦 3D View", "📐 Schematic"],
+                                  key="view_tab", on_change="rerun")
+
+with tab1:
+    if design_fits and tab1.open:
+        edge_grain_view(strips_key, board_width, board_length, show_grain, corner_radius)
+
+with tab2:
+    if design_fits and tab2.open:
+        end_grain_view(strips_key, board_width, board_length, show_grain)
+
+with tab3:
+    if design_fits and tab3.open:
+        three_d_view(st.session_state.strips, strips_key, board_width, board_length,
+                     board_thickness, view_angle)
+
+with tab4:
+    if design_fits and tab4.open:
+        schematic_view(strips_key, board_width, board_length)
 
 # Instructions
 with st.expander("ℹ️ How to Use"):
@@ -915,8 +1121,8 @@ with st.expander("ℹ️ How to Use"):
        - Or select "Custom Design" to create your own from scratch
        - Click "🎨 Apply Pattern" to load the pattern
     4. **Select number of strips** in the sidebar
-    5. **Choose wood type** for each strip from the dropdown
-    6. **Set width** for each strip
+    5. **Choose wood type** for each strip in the strip table
+    6. **Set width** for each strip in the table, then click ✅ Apply Strip Changes
     7. **Use strip tools** for quick edits:
        - 📋 Duplicate a strip
        - ⬆️⬇️ Reorder strips